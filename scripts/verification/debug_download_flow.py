@@ -4,9 +4,14 @@ Debug Download Workflow - Single Process Mode
 
 本脚本旨在绕过 FastAPI 和 Celery 的复杂性，直接在单进程中测试
 从服务层发起的搜索和下载流程，以便于调试和定位问题。
+搜索结果会在 `data/cache/debug_search/` 中缓存10分钟，删除该目录即可强制重新搜索。
 """
 import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
+import time
 from pathlib import Path
 
 # 配置一个简单的、清晰的日志记录器
@@ -31,6 +36,32 @@ except ImportError as e:
     exit(1)
 
 
+# 搜索结果的磁盘缓存：反复运行调试脚本时跳过相同条件的网络搜索
+SEARCH_CACHE_DIR = Path("data/cache/debug_search")
+SEARCH_CACHE_TTL_SECONDS = 600
+
+
+async def cached_search_reports(service, criteria):
+    """按搜索条件缓存 search_reports 的成功结果，过期或失败时重新搜索"""
+    criteria_json = json.dumps(
+        dataclasses.asdict(criteria), sort_keys=True, default=str
+    )
+    key = hashlib.sha1(criteria_json.encode("utf-8")).hexdigest()
+    cache_file = SEARCH_CACHE_DIR / f"{key}.json"
+
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < SEARCH_CACHE_TTL_SECONDS:
+        logging.info(f"命中搜索缓存: {cache_file}")
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+
+    search_result = await service.search_reports(criteria)
+    if search_result and search_result.get("success"):
+        SEARCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps(search_result, ensure_ascii=False, default=str), encoding="utf-8"
+        )
+    return search_result
+
+
 async def main():
     """主调试函数"""
     logging.info("=" * 50)
@@ -64,7 +95,7 @@ async def main():
     reports_to_download = []
     try:
         logging.info("探针[1]: 即将调用 fund_report_service.search_reports...")
-        search_result = await fund_report_service.search_reports(criteria)
+        search_result = await cached_search_reports(fund_report_service, criteria)
 
         if search_result and search_result.get("success"):
             reports_to_download = search_result.get("data", [])
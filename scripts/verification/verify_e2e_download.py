@@ -12,15 +12,25 @@ This serves as the final quality gate before proceeding to Phase 5.
 import asyncio
 import httpx
 import logging
-import time
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    # Installed with uvicorn[standard]; falls back to polling when unavailable.
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
 # --- Configuration ---
 API_BASE_URL = "http://127.0.0.1:8000"
 DOWNLOAD_DIR = Path("data/downloads/e2e_verification")
 VERIFICATION_TIMEOUT_SECONDS = 30
-POLL_INTERVAL_SECONDS = 5
+POLL_INTERVAL_SECONDS = 0.2
+DOWNLOAD_BATCH_SIZE = 50  # Reports per /api/downloads request
+# A single pooled client is shared by all API calls so keep-alive connections
+# are reused across the search and download-trigger requests.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
 # --- Test Target ---
 # We will search for a single fund's Q1 2025 report.
@@ -75,14 +85,12 @@ async def search_for_reports(client: httpx.AsyncClient) -> List[Dict[str, Any]]:
         return []
 
 
-async def trigger_download(
-    client: httpx.AsyncClient, reports: List[Dict[str, Any]]
+async def _post_download_batch(
+    client: httpx.AsyncClient, batch: List[Dict[str, Any]]
 ) -> str:
-    """Step 2: Trigger a download task for the found reports."""
-    logging.info("STEP 2: Triggering download task...")
-
+    """POST a single batch of reports and return the created task ID."""
     # The API now expects the full list of report objects, not just their IDs.
-    payload = {"reports": reports, "save_dir": str(DOWNLOAD_DIR)}
+    payload = {"reports": batch, "save_dir": str(DOWNLOAD_DIR)}
     try:
         response = await client.post(f"{API_BASE_URL}/api/downloads", json=payload)
         response.raise_for_status()
@@ -92,9 +100,7 @@ async def trigger_download(
             logging.error(f"API call to trigger download failed. Response: {data}")
             return ""
 
-        task_id = data["task_id"]
-        logging.info(f"SUCCESS: Download task created. Task ID: {task_id}")
-        return task_id
+        return data["task_id"]
     except httpx.HTTPStatusError as e:
         logging.error(
             f"HTTP error during download trigger: {e.response.status_code} - {e.response.text}"
@@ -105,8 +111,52 @@ async def trigger_download(
         return ""
 
 
-def verify_downloads(reports: List[Dict[str, Any]]) -> bool:
-    """Step 3: Poll the download directory to verify file creation."""
+async def trigger_download(
+    client: httpx.AsyncClient, reports: List[Dict[str, Any]]
+) -> List[str]:
+    """Step 2: Trigger download tasks for the found reports.
+
+    Large report lists are split into batches that are submitted concurrently.
+    Returns the created task IDs, or an empty list if any submission failed.
+    """
+    logging.info("STEP 2: Triggering download task...")
+
+    batches = [
+        reports[i : i + DOWNLOAD_BATCH_SIZE]
+        for i in range(0, len(reports), DOWNLOAD_BATCH_SIZE)
+    ]
+    task_ids = await asyncio.gather(
+        *(_post_download_batch(client, batch) for batch in batches)
+    )
+    if not all(task_ids):
+        return []
+
+    logging.info(f"SUCCESS: Download task(s) created. Task ID(s): {', '.join(task_ids)}")
+    return list(task_ids)
+
+
+async def _wait_for_file(file_path: Path) -> bool:
+    """Poll a single expected file until it appears."""
+    while not file_path.exists():
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+    return True
+
+
+async def _watch_for_files(expected_files: List[Path]) -> None:
+    """Wait for filesystem events until every expected file exists."""
+    pending = {p for p in expected_files if not p.exists()}
+    if not pending:
+        return
+    # yield_on_timeout lets us re-check existence periodically, covering files
+    # that were written before the watcher was armed.
+    async for _changes in awatch(DOWNLOAD_DIR, rust_timeout=1000, yield_on_timeout=True):
+        pending = {p for p in pending if not p.exists()}
+        if not pending:
+            return
+
+
+async def verify_downloads(reports: List[Dict[str, Any]]) -> bool:
+    """Step 3: Watch (or poll) the download directory to verify file creation."""
     logging.info("STEP 3: Verifying downloaded files...")
 
     expected_files = [
@@ -117,24 +167,28 @@ def verify_downloads(reports: List[Dict[str, Any]]) -> bool:
     for f in expected_files:
         logging.info(f"  - {f}")
 
-    start_time = time.time()
-    while time.time() - start_time < VERIFICATION_TIMEOUT_SECONDS:
-        all_found = True
-        for file_path in expected_files:
-            if not file_path.exists():
-                all_found = False
-                break
-
-        if all_found:
-            logging.info(
-                "SUCCESS: All expected files have been found in the download directory."
-            )
-            return True
-
+    if awatch is not None:
+        logging.info(
+            f"Verification in progress... watching {DOWNLOAD_DIR} "
+            f"for up to {VERIFICATION_TIMEOUT_SECONDS}s."
+        )
+        waiter = _watch_for_files(expected_files)
+    else:
+        logging.info(
+            f"Verification in progress... polling every {POLL_INTERVAL_SECONDS}s "
+            f"for up to {VERIFICATION_TIMEOUT_SECONDS}s."
+        )
+        # Each file gets its own waiter so completion is detected as soon as the
+        # last file lands, instead of on the next coarse polling tick.
+        waiter = asyncio.gather(*(_wait_for_file(p) for p in expected_files))
+    try:
+        await asyncio.wait_for(waiter, timeout=VERIFICATION_TIMEOUT_SECONDS)
         logging.info(
-            f"Verification in progress... waiting for files. Retrying in {POLL_INTERVAL_SECONDS}s."
+            "SUCCESS: All expected files have been found in the download directory."
         )
-        time.sleep(POLL_INTERVAL_SECONDS)
+        return True
+    except asyncio.TimeoutError:
+        pass
 
     logging.error(
         f"FAILURE: Verification timed out after {VERIFICATION_TIMEOUT_SECONDS} seconds."
@@ -153,7 +207,7 @@ async def main():
     # Ensure download directory exists
     DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT) as client:
         # Step 1
         reports_to_download = await search_for_reports(client)
         if not reports_to_download:
@@ -163,16 +217,15 @@ async def main():
             return
 
         # Step 2
-        task_id = await trigger_download(client, reports_to_download)
-        if not task_id:
+        task_ids = await trigger_download(client, reports_to_download)
+        if not task_ids:
             logging.error(
                 "Verification failed at Step 2: Could not trigger download task."
             )
             return
 
         # Step 3
-        # This part is synchronous as it involves polling the file system.
-        verification_success = verify_downloads(reports_to_download)
+        verification_success = await verify_downloads(reports_to_download)
         if not verification_success:
             logging.error(
                 "Verification failed at Step 3: Files were not downloaded correctly."
@@ -3,65 +3,219 @@
 
 本脚本旨在提供一个快速的反馈循环，用于测试和优化 XBRLParser 的解析能力。
 它会遍历 `tests/fixtures` 目录下的所有 XBRL 文件，使用解析器处理它们，
-并以人类可读的格式打印出提取的数据。
+并以一张汇总表打印出提取的数据；使用 `--json` 参数可改为逐行输出 JSON。
+
+各样本文件相互独立，解析过程是CPU密集型的，因此分发到多个工作进程并行执行。
+未改动的样本文件的解析摘要缓存在 `tests/.parse_cache/` 中，缓存键包含解析器源码、
+数据模型与解析配置的摘要，这些文件改动后缓存自动失效；使用 `--no-cache` 参数可跳过缓存。
 
 这避免了每次为了测试解析效果而运行完整的端到端下载流程。
 """
+import argparse
+import hashlib
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import sys
+from typing import Any, Dict, NamedTuple, Optional
+
+# src 包通过 `poetry install` 以可编辑模式安装（pyproject 中 packages = [{include = "src"}]），
+# 无需修改 sys.path；项目根目录仅用于定位样本与输出文件
+from src.parsers.xbrl_parser import XBRLParser
+from src.utils.model_utils import orm_to_summary_dict
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
-# 将 src 目录添加到 Python 路径中，以便导入模块
-# 这是一种在项目脚本中常见的做法
 project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.append(str(project_root))
 
-from src.parsers.xbrl_parser import XBRLParser
-from src.utils.model_utils import orm_to_dict
 
-def main():
+class FileResult(NamedTuple):
+    """单个样本文件的解析结果"""
+
+    file: str
+    status: str
+    data: Optional[Dict[str, Any]] = None
+
+
+# 解析摘要的磁盘缓存目录；解析相关文件的变化由 _parser_fingerprint 自动纳入缓存键，
+# CACHE_VERSION 仅在本脚本的摘要字段变化时递增
+CACHE_DIR = project_root / "tests" / ".parse_cache"
+CACHE_VERSION = 1
+
+# 影响解析结果的文件（相对项目根目录的 glob 模式）：解析器与其导入的数据模型、
+# 摘要转换工具、分类标准映射和解析器配置
+PARSER_SOURCES = (
+    "src/parsers/**/*.py",
+    "src/models/fund_data.py",
+    "src/models/enhanced_fund_data.py",
+    "src/utils/model_utils.py",
+    "config/xbrl_taxonomies/*.json",
+    "config/parser_config.yaml",
+)
+
+# 逐文件的解析结果以 JSON Lines 格式增量写入此文件
+RESULTS_FILE = project_root / "data" / "verification" / "parse_results.jsonl"
+
+# 每个工作进程持有一个解析器实例，避免每个文件都重新初始化
+_parser: Optional[XBRLParser] = None
+# 解析相关文件的摘要，由主进程计算一次后传给各工作进程；为 None 时不使用缓存
+_fingerprint: Optional[str] = None
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """将数据格式化为单行紧凑 JSON 文本，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _parser_fingerprint() -> str:
+    """计算影响解析结果的文件内容摘要，任一文件改动都会得到不同的值"""
+    digest = hashlib.blake2b(digest_size=16)
+    for pattern in PARSER_SOURCES:
+        for file_path in sorted(project_root.glob(pattern)):
+            digest.update(str(file_path.relative_to(project_root)).encode("utf-8"))
+            digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _cache_path(file_path: Path) -> Path:
+    """根据文件路径、修改时间、大小、解析器源码摘要和缓存版本计算缓存文件位置"""
+    stat = file_path.stat()
+    key_source = (
+        f"{file_path}|{stat.st_mtime_ns}|{stat.st_size}|{_fingerprint}|{CACHE_VERSION}"
+    )
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _init_worker(fingerprint: Optional[str]) -> None:
+    """工作进程初始化：创建本进程专用的解析器并记录解析相关文件的摘要"""
+    global _parser, _fingerprint
+    _parser = XBRLParser()
+    _fingerprint = fingerprint
+
+
+def _parse_one(file_path: Path) -> Optional[Dict[str, Any]]:
+    """在工作进程中解析单个文件，返回可跨进程传递的摘要字典（命中缓存时跳过解析）"""
+    if _fingerprint is None:
+        return _summarize(file_path)
+
+    cache_file = _cache_path(file_path)
+    if cache_file.exists():
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+
+    summary = _summarize(file_path)
+    if summary is not None:
+        cache_file.write_text(json.dumps(summary, ensure_ascii=False), encoding="utf-8")
+    return summary
+
+
+def _summarize(file_path: Path) -> Optional[Dict[str, Any]]:
+    """解析单个文件并提取摘要"""
+    report_obj = _parser.parse_file(file_path)
+    if not report_obj:
+        return None
+
+    # 摘要只需要关键字段和表格数据的计数，无需递归展开关联对象
+    report_dict = orm_to_summary_dict(report_obj)
+
+    # 为了更清晰的输出，我们只显示部分关键字段和表格数据的计数
+    return {
+        "fund_code": report_dict.get("fund_code"),
+        "fund_name": report_dict.get("fund_name"),
+        "net_asset_value": report_dict.get("net_asset_value"),
+        "total_net_assets": report_dict.get("total_net_assets"),
+        "asset_allocations_count": report_dict.get("asset_allocations_count", 0),
+        "top_holdings_count": report_dict.get("top_holdings_count", 0),
+        "industry_allocations_count": report_dict.get("industry_allocations_count", 0),
+    }
+
+
+def _format_table(results) -> str:
+    """将所有文件的解析结果格式化为一张对齐的汇总表"""
+    header = f"{'文件':40s} {'状态':4s} {'基金代码':10s} {'单位净值':>10s} {'资产':>4s} {'持仓':>4s} {'行业':>4s}"
+    rows = [header, "-" * len(header)]
+    for result in results:
+        data = result.data or {}
+        nav = data.get("net_asset_value")
+        rows.append(
+            f"{result.file:40s} {result.status:4s} {data.get('fund_code') or '-':10s} "
+            f"{'-' if nav is None else f'{nav:.4f}':>10s} "
+            f"{data.get('asset_allocations_count', 0):>4d} "
+            f"{data.get('top_holdings_count', 0):>4d} "
+            f"{data.get('industry_allocations_count', 0):>4d}"
+        )
+    return "\n".join(rows)
+
+
+def main(argv=None):
     """主执行函数"""
+    arg_parser = argparse.ArgumentParser(description="验证 XBRLParser 对样本文件的解析结果")
+    arg_parser.add_argument(
+        "--json", action="store_true", help="以 JSON Lines 格式逐行输出结果（机器可读）"
+    )
+    arg_parser.add_argument(
+        "--no-cache", action="store_true", help="不读取也不写入解析摘要缓存，强制重新解析所有文件"
+    )
+    args = arg_parser.parse_args(argv)
+
     fixtures_dir = project_root / "tests" / "fixtures"
-    xbrl_files = list(fixtures_dir.glob("*.xbrl"))
+    with os.scandir(fixtures_dir) as entries:
+        xbrl_files = [
+            Path(entry.path) for entry in entries if entry.name.endswith(".xbrl") and entry.is_file()
+        ]
 
     if not xbrl_files:
         print(f"错误：在 '{fixtures_dir}' 目录中未找到任何 .xbrl 文件。")
         return
 
-    print(f"--- 开始对 {len(xbrl_files)} 个样本文件进行解析验证 ---")
-
-    parser = XBRLParser()
-    all_results = []
-
-    for file_path in xbrl_files:
-        print(f"\n>>> 正在解析文件: {file_path.name}")
-        
-        report_obj = parser.parse_file(file_path)
-        
-        if report_obj:
-            # 使用 orm_to_dict 将 SQLAlchemy 对象转换为可序列化的字典
-            report_dict = orm_to_dict(report_obj)
-            
-            # 为了更清晰的输出，我们只显示部分关键字段和表格数据的计数
-            summary = {
-                "fund_code": report_dict.get("fund_code"),
-                "fund_name": report_dict.get("fund_name"),
-                "net_asset_value": report_dict.get("net_asset_value"),
-                "total_net_assets": report_dict.get("total_net_assets"),
-                "asset_allocations_count": len(report_dict.get("asset_allocations", [])),
-                "top_holdings_count": len(report_dict.get("top_holdings", [])),
-                "industry_allocations_count": len(report_dict.get("industry_allocations", [])),
-            }
-            print(json.dumps(summary, indent=2, ensure_ascii=False))
-            all_results.append({"file": file_path.name, "status": "成功", "data": summary})
-        else:
-            print("    解析失败，返回 None。")
-            all_results.append({"file": file_path.name, "status": "失败", "data": None})
+    if not args.json:
+        print(f"--- 开始对 {len(xbrl_files)} 个样本文件进行解析验证 ---")
+    fingerprint = None
+    if not args.no_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fingerprint = _parser_fingerprint()
+
+    results = []
+    successful_count = 0
+    max_workers = min(len(xbrl_files), os.cpu_count() or 1)
+
+    # 按文件批量分发以减少进程间通信次数；map 按输入顺序产出结果，输出稳定可比对
+    chunksize = max(1, len(xbrl_files) // (max_workers * 4))
+
+    RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    pool_options = dict(
+        max_workers=max_workers, initializer=_init_worker, initargs=(fingerprint,)
+    )
+    with ProcessPoolExecutor(**pool_options) as executor, \
+            RESULTS_FILE.open("w", encoding="utf-8") as results_out:
+        summaries = executor.map(_parse_one, xbrl_files, chunksize=chunksize)
+
+        for file_path, summary in zip(xbrl_files, summaries):
+            if summary:
+                result = FileResult(file_path.name, "成功", summary)
+                successful_count += 1
+            else:
+                result = FileResult(file_path.name, "失败")
+            line = _dumps(result._asdict())
+            results_out.write(line + "\n")
+            if args.json:
+                print(line)
+            results.append(result)
+
+    if args.json:
+        return
 
+    failed_count = len(results) - successful_count
+    # 所有结果汇总为一张表，一次性写出
+    print(_format_table(results))
     print("\n--- 解析验证完成 ---")
-    successful_count = sum(1 for r in all_results if r["status"] == "成功")
-    failed_count = len(all_results) - successful_count
     print(f"结果: {successful_count} 个文件成功, {failed_count} 个文件失败。")
+    print(f"逐文件结果已写入: {RESULTS_FILE}")
 
 
 if __name__ == "__main__":
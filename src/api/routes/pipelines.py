@@ -0,0 +1,60 @@
+"""
+API Route for dispatching the download-and-parse pipeline in a single request.
+"""
+import uuid
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from src.core.logging import get_logger
+from src.tasks.download_tasks import dispatch_download_chord
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/api/pipelines", tags=["处理流水线"])
+
+
+class PipelineCreateRequest(BaseModel):
+    reports: List[Dict[str, Any]] = Field(
+        ..., min_length=1, description="从搜索接口获得的报告对象列表"
+    )
+    save_dir: Optional[str] = Field("data/downloads", description="文件保存目录")
+
+
+class PipelineCreateResponse(BaseModel):
+    success: bool
+    message: str
+    task_id: str  # 批次ID，与 finalize_batch_download 的汇总结果对应
+    chord_task_id: str  # 直接轮询/订阅此任务获取最终结果
+
+
+@router.post("", response_model=PipelineCreateResponse, status_code=202)
+def create_pipeline(request: PipelineCreateRequest) -> PipelineCreateResponse:
+    """
+    在请求线程中直接构建并分发 下载→解析→保存 的chord，同步返回 chord_task_id。
+
+    与 POST /api/downloads 不同，这里不经过 start_download_pipeline 编排任务，
+    客户端无需先轮询编排任务即可拿到最终结果所在的任务ID。
+    """
+    batch_task_id = str(uuid.uuid4())
+    bound_logger = logger.bind(
+        batch_task_id=batch_task_id, report_count=len(request.reports)
+    )
+
+    try:
+        chord_result = dispatch_download_chord(
+            batch_task_id, request.reports, request.save_dir
+        )
+    except Exception as e:
+        bound_logger.error("pipelines.create.dispatch_failed", error=str(e))
+        raise HTTPException(status_code=500, detail=f"流水线分发失败: {e}")
+
+    bound_logger.info("pipelines.create.dispatched", chord_task_id=chord_result.id)
+
+    return PipelineCreateResponse(
+        success=True,
+        message="处理流水线已分发到Celery队列",
+        task_id=batch_task_id,
+        chord_task_id=chord_result.id,
+    )
@@ -1,7 +1,16 @@
 """
 API Route for querying the status of Celery tasks.
 """
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from celery import states
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 from celery.result import AsyncResult
 from src.core.celery_app import app as celery_app
 from src.core.logging import get_logger
@@ -9,47 +18,206 @@ from src.core.logging import get_logger
 router = APIRouter(prefix="/api")
 logger = get_logger(__name__)
 
+# Upper bound for the long-poll wait. Each waiting request holds one worker of the
+# threadpool shared by all sync endpoints (AnyIO default: 40), so keep it short.
+MAX_WAIT_SECONDS = 30
+# Server-Sent Events: backend state check interval and keep-alive comment interval
+SSE_POLL_INTERVAL_SECONDS = 0.5
+SSE_PING_INTERVAL_SECONDS = 15
+# Server-side lifetime of one event stream; unknown task ids stay PENDING forever
+SSE_MAX_STREAM_SECONDS = 600
+# In-process status cache: non-terminal states are served for up to the TTL,
+# terminal (ready) states are kept until evicted by the size bound.
+STATUS_CACHE_TTL_SECONDS = 1.0
+STATUS_CACHE_MAX_ENTRIES = 1024
+
+# task_id -> (expires_at, payload); expires_at is None for terminal states
+_status_cache: Dict[str, Tuple[Optional[float], dict]] = {}
+_status_cache_lock = threading.Lock()
+
+
+def _get_cached_status(task_id: str) -> Optional[dict]:
+    """Return the cached status payload if it is still fresh."""
+    with _status_cache_lock:
+        entry = _status_cache.get(task_id)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del _status_cache[task_id]
+            return None
+        return payload
+
+
+def _cache_status(task_id: str, payload: dict) -> None:
+    """Store a status payload, evicting the oldest entry when the cache is full."""
+    expires_at = None if payload["ready"] else time.monotonic() + STATUS_CACHE_TTL_SECONDS
+    with _status_cache_lock:
+        if task_id not in _status_cache and len(_status_cache) >= STATUS_CACHE_MAX_ENTRIES:
+            del _status_cache[next(iter(_status_cache))]
+        _status_cache[task_id] = (expires_at, payload)
+
+
+def clear_status_cache() -> None:
+    """Drop all cached task status payloads."""
+    with _status_cache_lock:
+        _status_cache.clear()
+
+
 @router.get("/tasks/{task_id}/status", tags=["Tasks Status"])
-def get_task_status(task_id: str):
+def get_task_status(
+    task_id: str,
+    wait: int = Query(
+        0,
+        ge=0,
+        le=MAX_WAIT_SECONDS,
+        description="Long-poll: block up to this many seconds for the task to become ready",
+    ),
+):
     """
     Query the status and result of a Celery task.
     
     This endpoint allows polling for the result of a long-running asynchronous task.
+    With ``wait > 0`` the request hangs until the task is ready or ``wait`` seconds
+    have passed, then returns the current state (long-polling). The wait blocks a
+    threadpool worker for its whole duration, so clients watching many tasks at
+    once should use ``/tasks/{task_id}/events`` instead.
+
+    Responses are cached in-process: terminal states indefinitely, other states
+    for ``STATUS_CACHE_TTL_SECONDS``, so bursts of polls hit the backend once.
     """
-    bound_logger = logger.bind(task_id=task_id)
+    bound_logger = logger.bind(task_id=task_id, wait=wait)
     bound_logger.info("task.status.requested")
 
+    cached = _get_cached_status(task_id)
+    # A cached terminal state answers any request; a cached pending state is
+    # only good enough for plain polls, long-polls must go to the backend.
+    if cached is not None and (cached["ready"] or not wait):
+        bound_logger.info("task.status.cache_hit")
+        return cached
+
     try:
         # Use the task_id to get the AsyncResult object from Celery
         task_result = AsyncResult(id=task_id, app=celery_app)
 
-        response_data = {
-            "task_id": task_id,
-            "status": task_result.status,
-            "ready": task_result.ready(),
-        }
-
-        if task_result.successful():
-            bound_logger.info("task.status.success")
-            # .get() retrieves the final return value of the task
-            task_return_value = task_result.get()
-            response_data["result"] = task_return_value
-            
-            # If this is a start_download_pipeline task, also return the chord_task_id
-            if isinstance(task_return_value, dict) and "chord_task_id" in task_return_value:
-                response_data["chord_task_id"] = task_return_value["chord_task_id"]
-        elif task_result.failed():
-            bound_logger.error("task.status.failed", reason=str(task_result.info))
-            response_data["error_info"] = str(task_result.info)
-            # For security, we might not want to expose the full traceback in production
-            # response_data["traceback"] = task_result.traceback
-        else:
-            # Task is still pending, revoked, or in another state
-            bound_logger.info("task.status.pending_or_other")
-            response_data["result"] = None
+        if wait and not task_result.ready():
+            try:
+                # The Redis result backend waits on pub/sub, so this returns as
+                # soon as the task finishes rather than on a polling tick.
+                task_result.get(timeout=wait, propagate=False)
+            except CeleryTimeoutError:
+                bound_logger.info("task.status.wait_timeout")
 
+        response_data = _build_status_payload(task_id, task_result, bound_logger)
+        _cache_status(task_id, response_data)
         return response_data
 
     except Exception as e:
         bound_logger.error("task.status.api_error", error=str(e))
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred while fetching task status: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred while fetching task status: {e}")
+
+
+def _build_status_payload(task_id: str, task_result: AsyncResult, bound_logger) -> dict:
+    """Build the status response body shared by the polling and streaming endpoints."""
+    response_data = {
+        "task_id": task_id,
+        "status": task_result.status,
+        "ready": task_result.ready(),
+    }
+
+    if task_result.successful():
+        bound_logger.info("task.status.success")
+        # .get() retrieves the final return value of the task
+        task_return_value = task_result.get()
+        response_data["result"] = task_return_value
+        
+        # If this is a start_download_pipeline task, also return the chord_task_id
+        if isinstance(task_return_value, dict) and "chord_task_id" in task_return_value:
+            response_data["chord_task_id"] = task_return_value["chord_task_id"]
+    elif task_result.failed():
+        bound_logger.error("task.status.failed", reason=str(task_result.info))
+        response_data["error_info"] = str(task_result.info)
+        # For security, we might not want to expose the full traceback in production
+        # response_data["traceback"] = task_result.traceback
+    else:
+        # Task is still pending, revoked, or in another state
+        bound_logger.info("task.status.pending_or_other")
+        response_data["result"] = None
+
+    return response_data
+
+
+def _sse_frame(event: str, data: dict) -> str:
+    """Format a single Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+@router.get("/tasks/{task_id}/events", tags=["Tasks Status"])
+async def stream_task_events(task_id: str):
+    """
+    Stream the state of a Celery task as Server-Sent Events.
+
+    Emits a ``status`` frame on every state change and a single ``final`` frame
+    (same body as the status endpoint) once the task is ready, then closes.
+    A ``: ping`` comment is sent every few seconds to keep proxies from dropping
+    the idle connection. If the task is not ready within ``SSE_MAX_STREAM_SECONDS``
+    a ``timeout`` frame is sent and the stream closes.
+
+    State checks share the in-process status cache with the status endpoint.
+    """
+    bound_logger = logger.bind(task_id=task_id)
+    bound_logger.info("task.events.requested")
+
+    async def event_stream():
+        last_status = None
+        last_sent = time.monotonic()
+        deadline = last_sent + SSE_MAX_STREAM_SECONDS
+        try:
+            task_result = AsyncResult(id=task_id, app=celery_app)
+            while True:
+                cached = _get_cached_status(task_id)
+                if cached is not None and cached["ready"]:
+                    yield _sse_frame("final", cached)
+                    return
+
+                if cached is not None:
+                    status = cached["status"]
+                else:
+                    # Result backend lookups are blocking; keep them off the event loop
+                    status = await asyncio.to_thread(lambda: task_result.state)
+                    if status in states.READY_STATES:
+                        payload = await asyncio.to_thread(
+                            _build_status_payload, task_id, task_result, bound_logger
+                        )
+                        _cache_status(task_id, payload)
+                        yield _sse_frame("final", payload)
+                        return
+
+                frame = {"task_id": task_id, "status": status, "ready": False}
+                if cached is None:
+                    _cache_status(task_id, {**frame, "result": None})
+
+                now = time.monotonic()
+                if status != last_status:
+                    yield _sse_frame("status", frame)
+                    last_status = status
+                    last_sent = now
+                elif now - last_sent >= SSE_PING_INTERVAL_SECONDS:
+                    yield ": ping\n\n"
+                    last_sent = now
+
+                if now >= deadline:
+                    bound_logger.warning("task.events.stream_timeout", status=status)
+                    yield _sse_frame("timeout", frame)
+                    return
+
+                await asyncio.sleep(SSE_POLL_INTERVAL_SECONDS)
+        except Exception as e:
+            bound_logger.error("task.events.stream_error", error=str(e))
+            yield _sse_frame("error", {"task_id": task_id, "error_info": str(e)})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -34,6 +34,8 @@ app.conf.update(
     # 任务路由配置
     task_routes={
         "src.tasks.download_tasks.download_fund_report_task": {"queue": "download"},
+        # 下载链的网络I/O步骤单独路由，可由gevent worker消费；解析与入库留在default队列
+        "src.tasks.download_tasks.download_report_chain": {"queue": "download"},
         "src.tasks.download_tasks.test_celery_task": {"queue": "default"},
     },
     # 队列设置
@@ -72,6 +74,10 @@ app.conf.task_routes.update(
             "queue": "download",
             "routing_key": "download",
         },
+        "src.tasks.download_tasks.download_report_chain": {
+            "queue": "download",
+            "routing_key": "download",
+        },
         # 测试任务使用默认队列
         "src.tasks.download_tasks.test_celery_task": {
             "queue": "default",
@@ -91,6 +97,13 @@ logger.info(
 )
 
 
+# 启动校验时必须已注册的任务
+EXPECTED_TASKS = (
+    "src.tasks.download_tasks.download_fund_report_task",
+    "src.tasks.download_tasks.test_celery_task",
+)
+
+
 # 辅助函数
 def get_celery_app() -> Celery:
     """获取Celery应用实例"""
@@ -122,18 +135,31 @@ def validate_configuration():
         logger.info("celery.config.redis_connection.ok")
 
         # 验证任务注册
-        registered_tasks = list(app.tasks.keys())
-        expected_tasks = [
-            "src.tasks.download_tasks.download_fund_report_task",
-            "src.tasks.download_tasks.test_celery_task",
-        ]
+        registered_tasks = frozenset(app.tasks)
 
-        for task in expected_tasks:
+        for task in EXPECTED_TASKS:
             if task in registered_tasks:
                 logger.info("celery.config.task_registered", task=task)
             else:
                 logger.warning("celery.config.task_missing", task=task)
 
+        # 下载任务为I/O密集型长任务，预取多个任务会造成队头阻塞
+        if app.conf.worker_prefetch_multiplier != 1:
+            logger.error(
+                "celery.config.prefetch_multiplier_invalid",
+                expected=1,
+                actual=app.conf.worker_prefetch_multiplier,
+                hint="请在 src/core/celery_app.py 中设置 worker_prefetch_multiplier=1",
+            )
+            return False
+
+        # 下载任务基于 upload_info_id 幂等，延迟确认可保证worker崩溃时任务重新入队
+        if not app.conf.task_acks_late:
+            logger.warning(
+                "celery.config.acks_late_disabled",
+                hint="长时间下载任务建议同时设置 task_acks_late=True 与 worker_prefetch_multiplier=1",
+            )
+
         return True
 
     except Exception as e:
@@ -74,7 +74,7 @@ class FundType(str, Enum):
         return descriptions.get(value, "未知基金类型")
 
 
-@dataclass
+@dataclass(frozen=True)
 class FundSearchCriteria:
     """基金搜索条件"""
 
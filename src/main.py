@@ -80,11 +80,12 @@ def create_app(http_client: aiohttp.ClientSession = None) -> FastAPI:
     )
 
     # 导入路由模块
-    from src.api.routes import reports, downloads, tasks
+    from src.api.routes import reports, downloads, tasks, pipelines
 
     app.include_router(reports.router, tags=["报告搜索"])
     app.include_router(downloads.router, tags=["下载任务"])
     app.include_router(tasks.router, tags=["任务状态"])
+    app.include_router(pipelines.router, tags=["处理流水线"])
 
     class HealthResponse(BaseModel):
         status: str
@@ -5,12 +5,51 @@ Format detector - automatically identify file format and route to appropriate pa
 
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Pattern, Tuple
 from enum import Enum
 
 from src.core.logging import get_logger
 
 
+def _compile_patterns(*patterns: str) -> Tuple[Pattern[str], ...]:
+    """预编译格式特征正则（大小写不敏感）"""
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
+# XBRL格式特征
+_XBRL_PATTERNS = _compile_patterns(
+    r'<xbrl[^>]*xmlns[^>]*>',
+    r'<xbrli:xbrl[^>]*>',
+    r'xmlns:xbrli=',
+    r'http://www\.xbrl\.org/2003/instance',
+    r'<context[^>]*id=',
+    r'<unit[^>]*id=',
+    r'<fact[^>]*>'
+)
+
+# iXBRL格式特征
+_IXBRL_PATTERNS = _compile_patterns(
+    r'<html[^>]*xmlns:ix[^>]*>',
+    r'xmlns:ix=',
+    r'http://www\.xbrl\.org/2013/inlineXBRL',
+    r'<ix:[^>]*>',
+    r'ix:name=',
+    r'ix:format=',
+    r'<ix:nonNumeric[^>]*>',
+    r'<ix:nonFraction[^>]*>'
+)
+
+# HTML格式特征
+_HTML_PATTERNS = _compile_patterns(
+    r'<!DOCTYPE html',
+    r'<html[^>]*>',
+    r'<head[^>]*>',
+    r'<body[^>]*>',
+    r'<table[^>]*>',
+    r'<div[^>]*>'
+)
+
+
 class DocumentFormat(Enum):
     """文档格式枚举"""
     XBRL = "xbrl"           # 标准XBRL格式
@@ -25,38 +64,10 @@ class FormatDetector:
     def __init__(self):
         self.logger = get_logger("format_detector")
         
-        # XBRL格式特征
-        self.xbrl_patterns = [
-            r'<xbrl[^>]*xmlns[^>]*>',
-            r'<xbrli:xbrl[^>]*>',
-            r'xmlns:xbrli=',
-            r'http://www\.xbrl\.org/2003/instance',
-            r'<context[^>]*id=',
-            r'<unit[^>]*id=',
-            r'<fact[^>]*>'
-        ]
-        
-        # iXBRL格式特征
-        self.ixbrl_patterns = [
-            r'<html[^>]*xmlns:ix[^>]*>',
-            r'xmlns:ix=',
-            r'http://www\.xbrl\.org/2013/inlineXBRL',
-            r'<ix:[^>]*>',
-            r'ix:name=',
-            r'ix:format=',
-            r'<ix:nonNumeric[^>]*>',
-            r'<ix:nonFraction[^>]*>'
-        ]
-        
-        # HTML格式特征
-        self.html_patterns = [
-            r'<!DOCTYPE html',
-            r'<html[^>]*>',
-            r'<head[^>]*>',
-            r'<body[^>]*>',
-            r'<table[^>]*>',
-            r'<div[^>]*>'
-        ]
+        # 格式特征正则在模块加载时预编译，所有实例共享
+        self.xbrl_patterns = _XBRL_PATTERNS
+        self.ixbrl_patterns = _IXBRL_PATTERNS
+        self.html_patterns = _HTML_PATTERNS
         
         # 基金报告特征关键词
         self.fund_report_keywords = [
@@ -139,17 +150,17 @@ class FormatDetector:
         
         # XBRL格式置信度
         xbrl_matches = sum(1 for pattern in self.xbrl_patterns 
-                          if re.search(pattern, content_sample, re.IGNORECASE))
+                          if pattern.search(content_sample))
         confidence_scores[DocumentFormat.XBRL] = min(1.0, xbrl_matches / len(self.xbrl_patterns))
         
         # iXBRL格式置信度
         ixbrl_matches = sum(1 for pattern in self.ixbrl_patterns 
-                           if re.search(pattern, content_sample, re.IGNORECASE))
+                           if pattern.search(content_sample))
         confidence_scores[DocumentFormat.IXBRL] = min(1.0, ixbrl_matches / len(self.ixbrl_patterns))
         
         # HTML格式置信度
         html_matches = sum(1 for pattern in self.html_patterns 
-                          if re.search(pattern, content_sample, re.IGNORECASE))
+                          if pattern.search(content_sample))
         html_confidence = min(1.0, html_matches / len(self.html_patterns))
         
         # 如果是HTML，检查基金报告关键词以提高置信度
@@ -206,13 +217,13 @@ class FormatDetector:
         
         Args:
             content: 内容
-            patterns: 模式列表
+            patterns: 预编译的模式列表
             
         Returns:
             bool: 是否匹配
         """
         matches = sum(1 for pattern in patterns 
-                     if re.search(pattern, content, re.IGNORECASE))
+                     if pattern.search(content))
         
         # 至少匹配一半的模式才认为是该格式
         return matches >= len(patterns) * 0.5
@@ -6,6 +6,7 @@
 
 import time
 import asyncio
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Type, Any
 from dataclasses import dataclass, field
@@ -28,14 +29,8 @@ class ParsingMetrics:
     failed_parses: int = 0
     total_processing_time: float = 0.0
     average_processing_time: float = 0.0
-    format_distribution: Dict[str, int] = None
-    parser_usage: Dict[str, int] = None
-    
-    def __post_init__(self):
-        if self.format_distribution is None:
-            self.format_distribution = {}
-        if self.parser_usage is None:
-            self.parser_usage = {}
+    format_distribution: Counter = field(default_factory=Counter)
+    parser_usage: Counter = field(default_factory=Counter)
     
     @property
     def success_rate(self) -> float:
@@ -56,11 +51,23 @@ class ParsingMetrics:
             self.failed_parses += 1
         
         # 更新格式分布
-        self.format_distribution[format_type] = self.format_distribution.get(format_type, 0) + 1
+        self.format_distribution[format_type] += 1
         
         # 更新解析器使用统计
-        parser_name = parse_result.parser_type.value
-        self.parser_usage[parser_name] = self.parser_usage.get(parser_name, 0) + 1
+        self.parser_usage[parse_result.parser_type.value] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为普通字典（dataclasses.asdict 会把 Counter 字段按键值对重新计数，不能直接使用）"""
+        return {
+            "total_files_processed": self.total_files_processed,
+            "successful_parses": self.successful_parses,
+            "failed_parses": self.failed_parses,
+            "total_processing_time": self.total_processing_time,
+            "average_processing_time": self.average_processing_time,
+            "success_rate": self.success_rate,
+            "format_distribution": dict(self.format_distribution),
+            "parser_usage": dict(self.parser_usage),
+        }
 
 
 class XBRLParserFacade:
@@ -396,19 +403,28 @@ class XBRLParserFacade:
     def _read_file_safely(self, file_path: Path) -> Optional[str]:
         """
         安全地读取文件
-        
+
+        绝大多数XBRL文件为UTF-8编码，先走严格UTF-8解码的快速路径（C层批量校验），
+        仅在解码失败时才回退到逐字节统计的chardet编码探测。
+
         Args:
             file_path: 文件路径
-            
+
         Returns:
             Optional[str]: 文件内容，失败时返回None
         """
         try:
-            import chardet
-            
             with open(file_path, "rb") as f:
                 raw_data = f.read()
-            
+
+            try:
+                # utf-8-sig 同时兼容带BOM与不带BOM的UTF-8文件
+                return raw_data.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                pass
+
+            import chardet
+
             encoding = chardet.detect(raw_data)["encoding"] or "utf-8"
             return raw_data.decode(encoding, errors="ignore")
             
@@ -9,6 +9,19 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 事实元素选择器（模块加载时预编译一次）。
+# This XPath combines specific selectors for performance with a general
+# selector for custom data elements, as required by the tests.
+_FACT_ELEMENTS_XPATH = etree.XPath(
+    '//*[@contextRef] | //*[@contextref] | '
+    '//*[@unitRef] | //*[@unitref] | '
+    '//span[@name] | '
+    '//*[namespace-uri() and '
+    '    namespace-uri() != "http://www.xbrl.org/2003/instance" and '
+    '    namespace-uri() != "http://www.xbrl.org/2003/linkbase" and '
+    '    namespace-uri() != "http://www.w3.org/1999/xhtml"]'
+)
+
 
 class FactExtractor:
     """XBRL事实提取器
@@ -154,17 +167,7 @@ class FactExtractor:
         3. 它有 `name` 属性 (iXBRL).
         4. 它是非XBRL标准命名空间中的任何其他元素 (项目特定数据).
         """
-        # This final XPath combines specific selectors for performance with a general
-        # selector for custom data elements, as required by the tests.
-        fact_elements = self.document.xpath(
-            '//*[@contextRef] | //*[@contextref] | '
-            '//*[@unitRef] | //*[@unitref] | '
-            '//span[@name] | '
-            '//*[namespace-uri() and '
-            '    namespace-uri() != "http://www.xbrl.org/2003/instance" and '
-            '    namespace-uri() != "http://www.xbrl.org/2003/linkbase" and '
-            '    namespace-uri() != "http://www.w3.org/1999/xhtml"]'
-        )
+        fact_elements = _FACT_ELEMENTS_XPATH(self.document)
         
         nsmap = self.document.nsmap
         
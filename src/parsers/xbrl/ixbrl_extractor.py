@@ -12,6 +12,10 @@ from lxml import etree
 
 from src.core.logging import get_logger
 
+# XPath expressions are compiled once at import time and shared by all instances
+_BODY_XBRL_XPATH = etree.XPath("//body//*[local-name()='xbrl']")
+_ANY_XBRL_XPATH = etree.XPath("//*[local-name()='xbrl']")
+
 
 class iXBRLExtractor:
     """Extractor for iXBRL (Inline XBRL) content from HTML files.
@@ -43,11 +47,11 @@ class iXBRLExtractor:
             tree = etree.fromstring(html_content.encode('utf-8'), self.html_parser)
             
             # Try primary XPath expression to find XBRL root element
-            xbrl_elements = tree.xpath("//body//*[local-name()='xbrl']")
+            xbrl_elements = _BODY_XBRL_XPATH(tree)
             
             # If primary expression fails, try backup expression
             if not xbrl_elements:
-                xbrl_elements = tree.xpath("//*[local-name()='xbrl']")
+                xbrl_elements = _ANY_XBRL_XPATH(tree)
             
             # If still no XBRL elements found, return None
             if not xbrl_elements:
@@ -10,6 +10,13 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 预编译XPath表达式（模块加载时编译一次，所有实例共享）
+# 使用local-name()使其对命名空间前缀不敏感
+_CONTEXT_XPATH = etree.XPath("//*[local-name()='context']")
+_CHILD_BY_LOCAL_NAME_XPATH = etree.XPath("./*[local-name()=$name]")
+_EXPLICIT_MEMBER_XPATH = etree.XPath(".//*[local-name()='explicitMember']")
+_TYPED_MEMBER_XPATH = etree.XPath(".//*[local-name()='typedMember']")
+
 
 class XBRLContext:
     """XBRL上下文解析器
@@ -32,8 +39,7 @@ class XBRLContext:
         logger.info("开始解析XBRL上下文")
         
         try:
-            # 使用local-name()使其对命名空间前缀不敏感
-            context_elements = self.document.xpath("//*[local-name()='context']")
+            context_elements = _CONTEXT_XPATH(self.document)
             
             for context_elem in context_elements:
                 context_data = self._extract_context_data(context_elem)
@@ -113,15 +119,14 @@ class XBRLContext:
         """从元素中提取场景数据"""
         scenario_data = {'explicitMembers': [], 'typedMembers': []}
         
-        # 使用local-name()来查找，忽略命名空间前缀
-        explicit_members = scenario_elem.xpath(".//*[local-name()='explicitMember']")
+        explicit_members = _EXPLICIT_MEMBER_XPATH(scenario_elem)
         for member in explicit_members:
             dimension = member.get('dimension')
             value = member.text.strip() if member.text else None
             if dimension and value:
                 scenario_data['explicitMembers'].append({'dimension': dimension, 'value': value})
         
-        typed_members = scenario_elem.xpath(".//*[local-name()='typedMember']")
+        typed_members = _TYPED_MEMBER_XPATH(scenario_elem)
         for member in typed_members:
             dimension = member.get('dimension')
             if dimension:
@@ -134,7 +139,7 @@ class XBRLContext:
     
     def _get_child_element(self, parent, child_name):
         """获取指定名称的第一个子元素，忽略命名空间"""
-        children = parent.xpath(f"./*[local-name()='{child_name}']")
+        children = _CHILD_BY_LOCAL_NAME_XPATH(parent, name=child_name)
         return children[0] if children else None
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
@@ -213,6 +213,33 @@ def finalize_batch_download(self, results: List[Dict], task_id: str):
     }
 
 
+def dispatch_download_chord(
+    task_id: str, reports_to_process: List[Dict[str, Any]], save_dir: str
+):
+    """
+    为报告列表构建并分发 下载→解析→保存 的处理流水线，返回chord回调的AsyncResult。
+    既被 start_download_pipeline 任务调用，也被 /api/pipelines 接口直接调用。
+    """
+    # 1. 为每个报告创建一个完整的处理链，并将它们组合成一个group
+    #    chain(...) 将任务链接起来
+    #    s(...) 创建一个带有预设参数的任务签名
+    #    group(...) 让所有任务链并行执行
+    job_group = group(
+        chain(
+            download_report_chain.s(report, save_dir=save_dir),
+            parse_report_chain.s(),
+            save_report_chain.s(),
+        )
+        for report in reports_to_process
+    )
+
+    # 2. 使用 chord(...) 编排
+    #    它会在job_group中的所有任务链都成功完成后，调用一次finalize_batch_download。
+    #    `results` of the group will be passed as the first argument to the callback.
+    callback = finalize_batch_download.s(task_id=task_id)
+    return chord(job_group)(callback)
+
+
 @celery_app.task(bind=True)
 def start_download_pipeline(
     self, task_id: str, reports_to_process: List[Dict[str, Any]], save_dir: str
@@ -236,26 +263,7 @@ def start_download_pipeline(
         finalize_batch_download.delay([], task_id)
         return
 
-    # 1. 为每个报告创建一个完整的处理链，并将它们组合成一个group
-    #    chain(...) 将任务链接起来
-    #    s(...) 创建一个带有预设参数的任务签名
-    #    group(...) 让所有任务链并行执行
-    job_group = group(
-        chain(
-            download_report_chain.s(report, save_dir=save_dir),
-            parse_report_chain.s(),
-            save_report_chain.s(),
-        )
-        for report in reports_to_process
-    )
-
-    # 3. 使用 chord(...) 编排
-    #    它会在job_group中的所有任务链都成功完成后，调用一次finalize_batch_download。
-    #    `results` of the group will be passed as the first argument to the callback.
-    callback = finalize_batch_download.s(task_id=task_id)
-    
-    # Capture the AsyncResult of the chord
-    chord_result = chord(job_group)(callback)
+    chord_result = dispatch_download_chord(task_id, reports_to_process, save_dir)
 
     bound_logger.info(
         "start_download_pipeline.pipeline_started", 
@@ -6,6 +6,16 @@ from datetime import datetime, date
 from decimal import Decimal
 from sqlalchemy.orm import class_mapper
 
+
+def _to_serializable(value):
+    """将日期和Decimal列值转换为可JSON序列化的类型"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
 def orm_to_dict(obj: object, visited: set = None) -> dict:
     """
     将一个SQLAlchemy ORM对象（瞬时态或持久态）及其关联对象递归地转换为字典。
@@ -29,13 +39,7 @@ def orm_to_dict(obj: object, visited: set = None) -> dict:
         # 遍历所有已定义的列属性
         for column in class_mapper(obj.__class__).columns:
             try:
-                value = getattr(obj, column.name)
-                if isinstance(value, (datetime, date)):
-                    data[column.name] = value.isoformat()
-                elif isinstance(value, Decimal):
-                    data[column.name] = float(value)
-                else:
-                    data[column.name] = value
+                data[column.name] = _to_serializable(getattr(obj, column.name))
             except Exception:
                 # 如果获取属性失败，跳过该属性
                 data[column.name] = None
@@ -63,3 +67,33 @@ def orm_to_dict(obj: object, visited: set = None) -> dict:
         return data
     finally:
         visited.discard(obj_id)
+
+
+def orm_to_summary_dict(obj: object) -> dict:
+    """
+    将一个SQLAlchemy ORM对象转换为摘要字典。
+    列属性与 orm_to_dict 的转换规则一致；一对多关联关系不再递归展开，
+    而是以 `<关系名>_count` 的形式只记录条目数量，适用于只需统计信息的场景。
+    需要完整关联数据（如API响应）时请使用 orm_to_dict。
+    """
+    if obj is None:
+        return None
+
+    mapper = class_mapper(obj.__class__)
+    data = {}
+    for column in mapper.columns:
+        try:
+            data[column.name] = _to_serializable(getattr(obj, column.name))
+        except Exception:
+            data[column.name] = None
+
+    for relationship in mapper.relationships:
+        if not relationship.uselist:
+            continue
+        try:
+            related_objs = getattr(obj, relationship.key)
+            data[f"{relationship.key}_count"] = len(related_objs) if related_objs is not None else 0
+        except Exception:
+            data[f"{relationship.key}_count"] = 0
+
+    return data
@@ -8,7 +8,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
-from src.parsers.parser_facade import XBRLParserFacade
+from src.parsers.parser_facade import ParsingMetrics, XBRLParserFacade
 from src.parsers.base_parser import ParseResult, ParserType
 from src.parsers.format_detector import DocumentFormat
 from src.models.enhanced_fund_data import ComprehensiveFundReport
@@ -220,4 +220,41 @@ class TestParserFacadeRouting:
         
         # 验证结果
         assert not result.success
-        assert "All parsing attempts failed." in result.errors
\ No newline at end of file
+        assert "All parsing attempts failed." in result.errors
+
+    def test_read_file_safely_utf8_fast_path(self, facade, tmp_path):
+        """测试UTF-8文件走快速路径，不触发chardet探测"""
+        file_path = tmp_path / "report.xbrl"
+        file_path.write_bytes("\ufeff<xbrl>基金代码</xbrl>".encode("utf-8"))
+
+        with patch('chardet.detect') as mock_detect:
+            content = facade._read_file_safely(file_path)
+
+        assert content == "<xbrl>基金代码</xbrl>"
+        mock_detect.assert_not_called()
+
+    def test_read_file_safely_falls_back_to_chardet(self, facade, tmp_path):
+        """测试非UTF-8文件回退到chardet编码探测"""
+        file_path = tmp_path / "report.xbrl"
+        file_path.write_bytes("<xbrl>基金代码</xbrl>".encode("gbk"))
+
+        with patch('chardet.detect', return_value={"encoding": "gbk"}) as mock_detect:
+            content = facade._read_file_safely(file_path)
+
+        assert content == "<xbrl>基金代码</xbrl>"
+        mock_detect.assert_called_once()
+
+    def test_parsing_metrics_to_dict(self, mock_success_result, mock_failure_result):
+        """测试解析指标计数并转换为普通字典"""
+        metrics = ParsingMetrics()
+        metrics.update_metrics(mock_success_result, 0.5, "xbrl")
+        metrics.update_metrics(mock_success_result, 0.5, "xbrl")
+        metrics.update_metrics(mock_failure_result, 1.0, "html")
+
+        data = metrics.to_dict()
+
+        assert data["format_distribution"] == {"xbrl": 2, "html": 1}
+        assert data["parser_usage"] == {ParserType.XBRL_NATIVE.value: 3}
+        assert data["successful_parses"] == 2
+        assert data["failed_parses"] == 1
+        assert type(data["format_distribution"]) is dict
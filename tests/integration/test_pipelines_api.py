@@ -0,0 +1,56 @@
+"""
+Integration tests for the Pipelines API
+"""
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, MagicMock
+
+from src.main import create_app
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the FastAPI app"""
+    app = create_app()
+    return TestClient(app)
+
+
+def test_create_pipeline_returns_chord_task_id(client):
+    """Test that the chord task ID is returned directly"""
+    reports = [{"upload_info_id": "1234567890", "fund_code": "015975"}]
+    with patch('src.api.routes.pipelines.dispatch_download_chord') as mock_dispatch:
+        mock_dispatch.return_value = MagicMock(id="chord-task-id")
+
+        response = client.post(
+            "/api/pipelines", json={"reports": reports, "save_dir": "/tmp/downloads"}
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["success"] is True
+        assert data["chord_task_id"] == "chord-task-id"
+        batch_task_id, dispatched_reports, save_dir = mock_dispatch.call_args.args
+        assert batch_task_id == data["task_id"]
+        assert dispatched_reports == reports
+        assert save_dir == "/tmp/downloads"
+
+
+def test_create_pipeline_rejects_empty_reports(client):
+    """Test that an empty report list is rejected before dispatching"""
+    with patch('src.api.routes.pipelines.dispatch_download_chord') as mock_dispatch:
+        response = client.post("/api/pipelines", json={"reports": []})
+
+        assert response.status_code == 422
+        mock_dispatch.assert_not_called()
+
+
+def test_create_pipeline_dispatch_error(client):
+    """Test that broker errors are reported as 500"""
+    reports = [{"upload_info_id": "1234567890", "fund_code": "015975"}]
+    with patch('src.api.routes.pipelines.dispatch_download_chord') as mock_dispatch:
+        mock_dispatch.side_effect = Exception("Redis connection failed")
+
+        response = client.post("/api/pipelines", json={"reports": reports})
+
+        assert response.status_code == 500
+        assert "流水线分发失败" in response.json()["detail"]
@@ -3,11 +3,20 @@ Integration tests for the Task Status API
 """
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock, call
 
+from src.api.routes.tasks import clear_status_cache
 from src.main import create_app
 
 
+@pytest.fixture(autouse=True)
+def _clear_status_cache():
+    """Every test reuses the same task id, so start each one with an empty cache"""
+    clear_status_cache()
+    yield
+    clear_status_cache()
+
+
 @pytest.fixture
 def client():
     """Create a test client for the FastAPI app"""
@@ -87,4 +96,189 @@ def test_get_task_status_exception(client):
         
         assert response.status_code == 500
         data = response.json()
-        assert "An unexpected error occurred while fetching task status" in data["detail"]
\ No newline at end of file
+        assert "An unexpected error occurred while fetching task status" in data["detail"]
+
+
+def test_get_task_status_long_poll_timeout(client):
+    """Test that wait>0 blocks on the result and returns the pending state on timeout"""
+    from celery.exceptions import TimeoutError as CeleryTimeoutError
+
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result:
+        mock_result = MagicMock()
+        mock_result.status = "PENDING"
+        mock_result.ready.return_value = False
+        mock_result.successful.return_value = False
+        mock_result.failed.return_value = False
+        mock_result.get.side_effect = CeleryTimeoutError()
+        mock_async_result.return_value = mock_result
+
+        response = client.get("/api/tasks/test-task-id/status", params={"wait": 5})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "PENDING"
+        assert data["ready"] is False
+        mock_result.get.assert_called_once_with(timeout=5, propagate=False)
+
+
+def test_get_task_status_long_poll_returns_result_when_task_finishes(client):
+    """Test that a task finishing during the wait is returned as the ready payload"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result:
+        finished = {"value": False}
+
+        def finish(*args, **kwargs):
+            finished["value"] = True
+            return {"successful": 1, "failed": 0}
+
+        mock_result = MagicMock()
+        type(mock_result).status = PropertyMock(
+            side_effect=lambda: "SUCCESS" if finished["value"] else "PENDING"
+        )
+        mock_result.ready.side_effect = lambda: finished["value"]
+        mock_result.successful.side_effect = lambda: finished["value"]
+        mock_result.failed.return_value = False
+        mock_result.get.side_effect = finish
+        mock_async_result.return_value = mock_result
+
+        response = client.get("/api/tasks/test-task-id/status", params={"wait": 5})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "SUCCESS"
+        assert data["ready"] is True
+        assert data["result"] == {"successful": 1, "failed": 0}
+        assert mock_result.get.call_args_list[0] == call(timeout=5, propagate=False)
+
+
+def test_get_task_status_long_poll_skipped_when_ready(client):
+    """Test that a ready task is returned immediately without waiting"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result:
+        mock_result = MagicMock()
+        mock_result.status = "SUCCESS"
+        mock_result.ready.return_value = True
+        mock_result.successful.return_value = True
+        mock_result.failed.return_value = False
+        mock_result.get.return_value = {"successful": 1, "failed": 0}
+        mock_async_result.return_value = mock_result
+
+        response = client.get("/api/tasks/test-task-id/status", params={"wait": 5})
+
+        assert response.status_code == 200
+        assert response.json()["result"] == {"successful": 1, "failed": 0}
+        mock_result.get.assert_called_once_with()
+
+
+def test_get_task_status_rejects_excessive_wait(client):
+    """Test that wait above the server limit is rejected"""
+    response = client.get("/api/tasks/test-task-id/status", params={"wait": 3600})
+
+    assert response.status_code == 422
+
+
+def test_stream_task_events_final_frame(client):
+    """Test that the event stream ends with a final frame for a ready task"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result:
+        mock_result = MagicMock()
+        mock_result.state = "SUCCESS"
+        mock_result.status = "SUCCESS"
+        mock_result.ready.return_value = True
+        mock_result.successful.return_value = True
+        mock_result.failed.return_value = False
+        mock_result.get.return_value = {"successful": 1, "failed": 0}
+        mock_async_result.return_value = mock_result
+
+        response = client.get("/api/tasks/test-task-id/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: final" in response.text
+        assert '"successful": 1' in response.text
+
+
+def test_stream_task_events_reports_state_changes(client):
+    """Test that each state transition is pushed before the final frame"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result, \
+            patch('src.api.routes.tasks.SSE_POLL_INTERVAL_SECONDS', 0), \
+            patch('src.api.routes.tasks.STATUS_CACHE_TTL_SECONDS', 0):
+        mock_result = MagicMock()
+        type(mock_result).state = PropertyMock(side_effect=["PENDING", "PENDING", "STARTED", "FAILURE"])
+        mock_result.status = "FAILURE"
+        mock_result.ready.return_value = True
+        mock_result.successful.return_value = False
+        mock_result.failed.return_value = True
+        mock_result.info = "boom"
+        mock_async_result.return_value = mock_result
+
+        response = client.get("/api/tasks/test-task-id/events")
+
+        events = [line for line in response.text.splitlines() if line.startswith("event:")]
+        assert events == ["event: status", "event: status", "event: final"]
+        assert '"error_info": "boom"' in response.text
+
+
+def test_stream_task_events_times_out(client):
+    """Test that a task that never becomes ready ends the stream with a timeout frame"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result, \
+            patch('src.api.routes.tasks.SSE_MAX_STREAM_SECONDS', 0):
+        mock_result = MagicMock()
+        mock_result.state = "PENDING"
+        mock_async_result.return_value = mock_result
+
+        response = client.get("/api/tasks/unknown-task-id/events")
+
+        events = [line for line in response.text.splitlines() if line.startswith("event:")]
+        assert events == ["event: status", "event: timeout"]
+
+
+def test_stream_task_events_uses_cached_final_status(client):
+    """Test that a cached terminal state is streamed without touching the backend"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result:
+        mock_result = MagicMock()
+        mock_result.status = "SUCCESS"
+        mock_result.ready.return_value = True
+        mock_result.successful.return_value = True
+        mock_result.failed.return_value = False
+        mock_result.get.return_value = {"successful": 1, "failed": 0}
+        mock_async_result.return_value = mock_result
+
+        client.get("/api/tasks/test-task-id/status")
+        mock_result.reset_mock()
+        response = client.get("/api/tasks/test-task-id/events")
+
+        assert "event: final" in response.text
+        mock_result.get.assert_not_called()
+
+
+def test_get_task_status_terminal_state_is_cached(client):
+    """Test that a finished task is served from cache without touching the backend"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result:
+        mock_result = MagicMock()
+        mock_result.status = "SUCCESS"
+        mock_result.ready.return_value = True
+        mock_result.successful.return_value = True
+        mock_result.failed.return_value = False
+        mock_result.get.return_value = {"successful": 1, "failed": 0}
+        mock_async_result.return_value = mock_result
+
+        first = client.get("/api/tasks/test-task-id/status")
+        second = client.get("/api/tasks/test-task-id/status")
+
+        assert first.json() == second.json()
+        assert mock_async_result.call_count == 1
+
+
+def test_get_task_status_pending_cache_expires(client):
+    """Test that a pending state is only reused within the TTL"""
+    with patch('src.api.routes.tasks.AsyncResult') as mock_async_result, \
+            patch('src.api.routes.tasks.STATUS_CACHE_TTL_SECONDS', 0):
+        mock_result = MagicMock()
+        mock_result.status = "PENDING"
+        mock_result.ready.return_value = False
+        mock_result.successful.return_value = False
+        mock_result.failed.return_value = False
+        mock_async_result.return_value = mock_result
+
+        client.get("/api/tasks/test-task-id/status")
+        client.get("/api/tasks/test-task-id/status")
+
+        assert mock_async_result.call_count == 2
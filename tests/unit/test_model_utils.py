@@ -0,0 +1,53 @@
+"""模型工具函数单元测试
+Model Utils Unit Tests
+"""
+
+from decimal import Decimal
+
+from src.models.fund_data import AssetAllocation, FundReport, TopHolding
+from src.utils.model_utils import orm_to_dict, orm_to_summary_dict
+
+
+def _build_report() -> FundReport:
+    report = FundReport(
+        fund_code="015975",
+        fund_name="测试基金",
+        net_asset_value=Decimal("1.2345"),
+    )
+    report.asset_allocations = [
+        AssetAllocation(asset_type="股票", market_value=Decimal("100.00")),
+        AssetAllocation(asset_type="债券", market_value=Decimal("50.00")),
+    ]
+    report.top_holdings = [
+        TopHolding(holding_type="股票", security_code="600519", security_name="贵州茅台"),
+    ]
+    return report
+
+
+def test_orm_to_summary_dict_returns_relationship_counts():
+    """摘要字典以计数代替关联列表"""
+    summary = orm_to_summary_dict(_build_report())
+
+    assert summary["fund_code"] == "015975"
+    assert summary["net_asset_value"] == 1.2345
+    assert summary["asset_allocations_count"] == 2
+    assert summary["top_holdings_count"] == 1
+    assert summary["industry_allocations_count"] == 0
+    assert "asset_allocations" not in summary
+
+
+def test_orm_to_summary_dict_matches_orm_to_dict_columns():
+    """列属性的转换结果与 orm_to_dict 一致"""
+    report = _build_report()
+    full = orm_to_dict(report)
+    summary = orm_to_summary_dict(report)
+
+    assert {k: v for k, v in full.items() if k in summary} == {
+        k: v for k, v in summary.items() if not k.endswith("_count")
+    }
+    assert len(full["asset_allocations"]) == summary["asset_allocations_count"]
+
+
+def test_orm_to_summary_dict_none():
+    """None 输入返回 None"""
+    assert orm_to_summary_dict(None) is None